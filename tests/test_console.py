@@ -1,79 +1,110 @@
 """Tests for ruleset module"""
 # pylint: disable=no-self-use, redefined-outer-name
 
+import builtins
 import string
 
 import colorama as cr  # type: ignore
 import pytest
 
 from wordlesolve.console import (
-    _letter_row,
-    _print_word_row,
+    _get_word_row,
+    _printable_alphabet,
     _validate_input,
+    _BORDERS,
+    _GUESS_TABLE,
+    _LETTER_BOXES,
     COLORS,
     display_test_outcomes,
     get_guess_input,
+    get_printable_alphabet,
     get_outcome_input,
     get_yn_input,
     GuessOutcome,
+    init_console,
     print_alphabet,
     print_word,
+    RESET_ALL,
 )
 from wordlesolve.ruleset import WordScore
 
 
+class TestInitConsole:
+    "init_console() function"
+
+    def test_init_console(self, monkeypatch):
+        "colorama is initialized once when stdout is a terminal"
+
+        calls = []
+        monkeypatch.setattr("colorama.init", lambda **kwargs: calls.append(kwargs))
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+        init_console.cache_clear()
+
+        init_console()
+        init_console()
+        assert calls == [{"autoreset": True}]
+
+    def test_not_a_tty(self, monkeypatch):
+        "colorama is skipped when stdout is not a terminal"
+
+        calls = []
+        monkeypatch.setattr("colorama.init", lambda **kwargs: calls.append(kwargs))
+        monkeypatch.setattr("sys.stdout.isatty", lambda: False)
+        init_console.cache_clear()
+
+        init_console()
+        assert not calls
+
+
 class TestPrintWord:
     "Tests of play mode console word printing"
 
-    def test_letter_row_content(self):
-        "Letter row - test content"
+    def test_letter_boxes_content(self):
+        "Letter boxes - test content"
 
-        # Top row = "---"
-        retval = _letter_row("A", 0, 0)
+        # Top / bottom row = "---"
+        retval = _BORDERS[0]
         assert "---" in retval
         assert "A" not in retval
 
         # Middle row = "| A |"
-        retval = _letter_row("A", 0, 1)
+        retval = _LETTER_BOXES["A", 0]
         assert "| A |" in retval
         assert "---" not in retval
 
-        # Bottom row = "---"
-        retval = _letter_row("A", 0, 2)
-        assert "---" in retval
-        assert "A" not in retval
-
-    def test_letter_row_colors(self):
-        "Letter row - test colors"
+    def test_letter_boxes_colors(self):
+        "Letter boxes - test colors"
 
         # 0 = red
-        retval = _letter_row("A", 0, 1)
+        retval = _LETTER_BOXES["A", 0]
         assert cr.Fore.RED in retval
         assert all(color not in retval for color in [cr.Fore.YELLOW, cr.Fore.GREEN])
 
         # 1 = yellow
-        retval = _letter_row("A", 1, 1)
+        retval = _LETTER_BOXES["A", 1]
         assert cr.Fore.YELLOW in retval
         assert all(color not in retval for color in [cr.Fore.RED, cr.Fore.GREEN])
 
         # 2 = green
-        retval = _letter_row("A", 2, 1)
+        retval = _LETTER_BOXES["A", 2]
         assert cr.Fore.GREEN in retval
         assert all(color not in retval for color in [cr.Fore.RED, cr.Fore.YELLOW])
 
-    def test_print_word_row(self, capsys):
-        "print_word_row() function"
+        # Borders are colored the same way
+        assert all(COLORS[status] in _BORDERS[status] for status in range(3))
+
+    def test_get_word_row(self):
+        "_get_word_row() function"
 
         # Middle row should contain all letters
-        _print_word_row("ABCDE", "00000", 1)
-        out = capsys.readouterr().out
-        assert all(letter in out for letter in "ABCDE")
-        assert all(letter not in out for letter in "FGHIJ")
+        out = _get_word_row("ABCDE", "00000", 1)
+        letters = set(out)
+        assert letters.issuperset("ABCDE")
+        assert letters.isdisjoint("FGHIJ")
 
         # Top / bottom row should contain no letters
-        _print_word_row("ABCDE", "00000", 0)
-        out = capsys.readouterr().out
-        assert all(letter not in out for letter in "ABCDE")
+        out = _get_word_row("ABCDE", "00000", 0)
+        assert set(out).isdisjoint("ABCDE")
 
     def test_print_word(self, capsys):
         "print_word() function"
@@ -81,8 +112,17 @@ class TestPrintWord:
         # Output should contain all letters
         print_word("ABCDE", "00000")
         out = capsys.readouterr().out
-        assert all(letter in out for letter in "ABCDE")
-        assert all(letter not in out for letter in "FGHIJ")
+        assert out.count("\n") == 3
+        letters = set(out)
+        assert letters.issuperset("ABCDE")
+        assert letters.isdisjoint("FGHIJ")
+
+        # Letter boxes are closed top and bottom
+        rows = out.splitlines()
+        assert rows[0] == rows[2] == _get_word_row("ABCDE", "00000", 0)
+
+        # Colors are reset at the end of each row
+        assert all(row.endswith(RESET_ALL) for row in rows)
 
 
 class TestPrintAlphabet:
@@ -94,29 +134,52 @@ class TestPrintAlphabet:
         # Start with all unknown status
         status = {letter: -1 for letter in string.ascii_uppercase}
         print_alphabet(status)
-        out = capsys.readouterr().out
-        assert COLORS[-1] in out
-        assert all(COLORS[n] not in out for n in (0, 1, 2))
 
         # Add an excluded letter
         status["A"] = 0
         print_alphabet(status)
-        out = capsys.readouterr().out
-        assert all(COLORS[n] in out for n in (-1, 0))
-        assert all(COLORS[n] not in out for n in (1, 2))
 
         # Add a known letter with unknown position
         status["B"] = 1
         print_alphabet(status)
-        out = capsys.readouterr().out
-        assert all(COLORS[n] in out for n in (-1, 0, 1))
-        assert COLORS[2] not in out
 
         # Add a known letter with known position
         status["C"] = 2
         print_alphabet(status)
-        out = capsys.readouterr().out
-        assert all(COLORS[n] in out for n in (-1, 0, 1, 2))
+
+        # One line of output per call
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 4
+
+        assert COLORS[-1] in lines[0]
+        assert all(COLORS[n] not in lines[0] for n in (0, 1, 2))
+
+        assert all(COLORS[n] in lines[1] for n in (-1, 0))
+        assert all(COLORS[n] not in lines[1] for n in (1, 2))
+
+        assert all(COLORS[n] in lines[2] for n in (-1, 0, 1))
+        assert COLORS[2] not in lines[2]
+
+        assert all(COLORS[n] in lines[3] for n in (-1, 0, 1, 2))
+
+    def test_unknown_alphabet(self):
+        "get_printable_alphabet() with every letter unknown"
+
+        status = {letter: -1 for letter in string.ascii_uppercase}
+        assert get_printable_alphabet(status) == (
+            " ".join(COLORS[-1] + letter for letter in string.ascii_uppercase)
+            + RESET_ALL
+        )
+
+    def test_alphabet_cached(self):
+        "get_printable_alphabet() reuses strings for the same status"
+
+        status = {letter: 0 for letter in string.ascii_uppercase}
+        first = get_printable_alphabet(status)
+        hits = _printable_alphabet.cache_info().hits
+
+        assert get_printable_alphabet(dict(status)) is first
+        assert _printable_alphabet.cache_info().hits == hits + 1
 
     def test_sep(self, capsys):
         "print_alphabet() sep argument"
@@ -181,6 +244,20 @@ class TestTestOutcome:
         # Includes info on guesses to solve
         assert "Matches: 0" in out
         assert "Outcome: 22222" in out
+        assert "Letters: " in out
+
+    def test_display_test_outcomes_no_alphabet(self, capsys, happy_test_outcome):
+        "Test outcome with verbosity 2 and no alphabet captured"
+
+        outcomes = {
+            word: [guess._replace(alphabet=None) for guess in guesses]
+            for word, guesses in happy_test_outcome.items()
+        }
+        display_test_outcomes(outcomes, 2.7, False, 2)
+        out = capsys.readouterr().out
+
+        assert "Matches: 0" in out
+        assert "Letters: " not in out
 
 
 class TestValidateInput:
@@ -190,19 +267,22 @@ class TestValidateInput:
         "_validate_input() function"
 
         # Valid
-        assert _validate_input("HAPPY", 5, string.ascii_letters)
+        assert _validate_input("HAPPY", 5, _GUESS_TABLE)
 
         # Wrong length
-        assert not _validate_input("HAPP", 5, string.ascii_letters)
+        assert not _validate_input("HAPP", 5, _GUESS_TABLE)
 
         # Invalid characters
-        assert not _validate_input("01210", 5, string.ascii_letters)
+        assert not _validate_input("01210", 5, _GUESS_TABLE)
+
+        # Non-ASCII characters
+        assert not _validate_input("HAPPÉ", 5, _GUESS_TABLE)
 
     def test_get_outcome_input(self, monkeypatch, capsys):
         "get_outcome_input() function"
 
         # Valid input - should return original string
-        monkeypatch.setattr("builtins.input", lambda _: "00112")
+        monkeypatch.setattr(builtins, "input", lambda _: "00112")
 
         assert get_outcome_input(11) == "00112"
         out = capsys.readouterr().out
@@ -213,8 +293,8 @@ class TestValidateInput:
 
         # Invalid input - should return second (valid) string
         input_values = ["abcde", "00112"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         assert get_outcome_input(11) == "00112"
         out = capsys.readouterr().out
@@ -224,7 +304,7 @@ class TestValidateInput:
         "get_guess_input() function"
 
         # Valid input - should return original string
-        monkeypatch.setattr("builtins.input", lambda _: "happy")
+        monkeypatch.setattr(builtins, "input", lambda _: "happy")
 
         assert get_guess_input() == "HAPPY"
         out = capsys.readouterr().out
@@ -235,8 +315,8 @@ class TestValidateInput:
 
         # Invalid input - should return second (valid) string
         input_values = ["01210", "HAPPY"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         assert get_guess_input() == "HAPPY"
         out = capsys.readouterr().out
@@ -246,7 +326,7 @@ class TestValidateInput:
         "get_yn_input() function"
 
         # Valid input - should return original string
-        monkeypatch.setattr("builtins.input", lambda _: "y")
+        monkeypatch.setattr(builtins, "input", lambda _: "y")
         assert get_yn_input("Play again (Y/N)?") == "Y"
 
     def test_get_yn_input_invalid(self, monkeypatch):
@@ -254,12 +334,12 @@ class TestValidateInput:
 
         # Invalid input - should return second (valid) string
         input_values = ["xxx", "Y"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
         assert get_yn_input("Play again (Y/N)?") == "Y"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def happy_test_outcome():
     "Actual outcome of test to find solutions ['HAPPY', 'ABCDE']"
 
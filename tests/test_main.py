@@ -3,7 +3,7 @@
 
 from argparse import Namespace
 
-from wordlesolve.__main__ import main, parse_args
+from wordlesolve.__main__ import _get_parser, main, parse_args
 
 
 class TestMain:
@@ -134,6 +134,18 @@ class TestParseArgs:
         assert args.verbosity == 0
         assert not args.hard
 
+        # Same as the defaults argparse would give
+        assert args == parse_args(["-s"])
+
+    def test_parser_reused(self):
+        "Parser is only built once"
+
+        assert _get_parser() is _get_parser()
+
+        # Earlier arguments don't carry over
+        assert parse_args(["--hard"]).hard
+        assert not parse_args(["-p"]).hard
+
     def test_hard(self):
         "hard mode"
 
@@ -3,7 +3,19 @@
 
 import pytest
 
-from wordlesolve.ruleset import Rule, RuleSet, WordScore
+from wordlesolve.ruleset import (
+    _letter_masks,
+    _occurrences,
+    _score_indices,
+    _WORD_INDICES,
+    _WORD_MASKS,
+    _WORD_OCCURRENCES,
+    index_words,
+    Rule,
+    RuleSet,
+    WordScore,
+)
+from wordlesolve.wordlist import WORDLIST
 
 
 @pytest.fixture
@@ -150,6 +162,60 @@ class TestRuleSet:
         matches = rule_set.filter_matches(words)
         assert matches == ["APPLE"]
 
+    def test_filter_matches_not_uppercase(self):
+        "filter_matches() with rules or words outside the uppercase alphabet"
+
+        rule_set = RuleSet()
+        rule_set.add_outcome("crane", "01000")
+        assert rule_set.filter_matches(["arise"]) == []
+
+        # Same result as is_match()
+        rule_set = RuleSet()
+        rule_set.add_outcome("CRANE", "01000")
+        words = ["ROUGH", "rough", "TIMID"]
+        assert rule_set.filter_matches(words) == [
+            word for word in words if rule_set.is_match(word)
+        ]
+
+    def test_filter_matches_incremental(self, ten_words):
+        "filter_matches() on the previous matches"
+
+        rule_set = RuleSet()
+        rule_set.add_outcome("COULD", "00000")
+        matches = rule_set.filter_matches(ten_words)
+        assert len(matches) == 5
+
+        # Filtering only the survivors gives the same result
+        # as filtering the full list again
+        rule_set.add_outcome("THINK", "22000")
+        assert rule_set.filter_matches(matches) == ["THERE"]
+        assert rule_set.filter_matches(ten_words) == ["THERE"]
+
+    def test_get_pattern(self, happy_rule_set):
+        "_get_pattern() method"
+
+        rule_set = happy_rule_set
+
+        assert rule_set._get_pattern().pattern == (
+            "(?=(?:[^A]*A){1})(?=(?:[^P]*P){2})[^HY][^HAY]P[^HPY][^HY]"
+        )
+
+        # Same result as is_match()
+        words = ["HIPPY", "POPPY", "APPLE", "PLANT", "APPPY", "UPSPY"]
+        for word in words:
+            assert bool(rule_set._get_pattern().fullmatch(word)) == rule_set.is_match(
+                word
+            )
+
+    def test_letter_masks(self):
+        "_letter_masks() function"
+
+        # One bit per letter present, repeated letters set the same bit
+        assert _letter_masks(["ABBEY", "AAAAA"]) == [
+            (1 << 0) | (1 << 1) | (1 << 4) | (1 << 24),
+            1 << 0,
+        ]
+
     def test_get_letter_status(self, happy_rule_set):
         "_get_letter_status() method"
 
@@ -225,6 +291,12 @@ class TestWordScoring:
         assert scores["P"] == [0, 0, 0, 0, 0]  # Mask is [0, 0, 1, 1, 1]
         assert scores["Y"] == [0, 0, 0, 0, 0]  # Mask is [0, 0, 0, 0, 0]
 
+    def test_occurrences(self):
+        "_occurrences() function"
+
+        # Second B is shifted along to count as a second occurrence
+        assert _occurrences(["ABBEY"]) == ["AB" + chr(ord("B") + 26) + "EY"]
+
     def test_get_position_mask(self, happy_rule_set):
         "_get_position_mask() method"
 
@@ -275,6 +347,23 @@ class TestWordScoring:
         assert scores["P"] == [1, 0, 0, 0, 0]  # mask is [1, 1, 0, 0, 1]
         assert scores["Y"] == [0, 0, 0, 0, 0]  # mask is [0, 0, 0, 0, 0]
 
+    def test_score_indices(self):
+        "_score_indices() function"
+
+        # One index per letter
+        # Each letter has 25 entries: 5 occurrences x 5 positions
+        assert _score_indices(["ABBEY"]) == [(0, 26, 32, 103, 604)]
+
+    def test_index_words(self):
+        "index_words() function"
+
+        index_words(["QUAYS"])
+
+        # All per-word caches are filled in
+        assert "QUAYS" in _WORD_MASKS
+        assert "QUAYS" in _WORD_INDICES
+        assert "QUAYS" in _WORD_OCCURRENCES
+
     def test_score_words(self, ten_words):
         "score_words() method"
 
@@ -287,6 +376,19 @@ class TestWordScoring:
         assert scores[0].score >= scores[1].score
         assert scores[0].frequency > 0
 
+    def test_score_words_top_k(self):
+        "score_words() method with top_k"
+
+        rule_set = RuleSet()
+        rule_set.add_outcome("RATES", "00100")
+        matches = rule_set.filter_matches(WORDLIST)
+        scores = rule_set.score_words(WORDLIST, matches)
+
+        # Same words in the same order as the top of the full list
+        assert rule_set.score_words(WORDLIST, matches, top_k=1) == scores[:1]
+        assert rule_set.score_words(WORDLIST, matches, top_k=5) == scores[:5]
+        assert rule_set.score_words(WORDLIST, matches, top_k=20) == scores[:20]
+
     def test_score_words_with_mask(self, ten_words):
         "score_words() method with mask"
 
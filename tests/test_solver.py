@@ -1,8 +1,20 @@
 """Tests for Solver class"""
 # pylint: disable=no-self-use, protected-access, too-few-public-methods
 
+import builtins
+
 from wordlesolve.ruleset import RuleSet
-from wordlesolve.solver import Solver, _get_outcome, _test_one, _run_tests
+from wordlesolve import solver as solver_module
+from wordlesolve.solver import (
+    Solver,
+    _cached,
+    _get_outcome,
+    _init_worker,
+    _max_workers,
+    _test_one,
+    _run_tests,
+    _worker_test_one,
+)
 from wordlesolve.wordlist import WORDLIST
 
 
@@ -22,6 +34,16 @@ class TestSolver:
         filtered = solver._filter_words(4.0)
         assert len(filtered) < len(solver.words)
 
+        # Words keep their word list order
+        assert filtered == sorted(filtered)
+        assert set(solver._filter_words(5.0)) < set(filtered)
+
+        # Zero frequency: every word
+        assert solver._filter_words(0.0) == list(solver.words)
+
+        # Each frequency is only filtered once
+        assert solver._filter_words(4.0) is filtered
+
 
 class TestSolve:
     "Test of solve mode"
@@ -31,8 +53,8 @@ class TestSolve:
 
         # mock input
         input_values = ["RATES", "11000", "BRAIN", "02100", "AROMA", "22222", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # solve mode
         solver = Solver()
@@ -44,13 +66,30 @@ class TestSolve:
         assert "I don't have any suggestions" not in out
         assert "I wasn't able to solve that one" not in out
 
+    def test_solve_another(self, monkeypatch, capsys):
+        "solve() - second puzzle starts with no rules"
+
+        # mock input - 'QZPTQ' will generate 0 suggestions in the first puzzle only
+        input_values = ["QZPTG", "11111", "GTZPQ", "22222", "Y"]
+        input_values += ["RATES", "11000", "BRAIN", "22222", "N"]
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
+
+        # solve mode
+        solver = Solver()
+        solver.solve()
+        out = capsys.readouterr().out
+
+        assert out.count("Congratulations - you solved it!") == 2
+        assert out.count("I don't have any suggestions") == 1
+
     def test_hard_mode(self, monkeypatch, capsys):
         "solve() success - hard mode"
 
         # mock input
         input_values = ["RATES", "22222", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # solve mode
         solver = Solver()
@@ -64,8 +103,8 @@ class TestSolve:
 
         # mock input - 'QZPTQ' will generate 0 suggestions
         input_values = ["QZPTG", "11111", "GTZPQ", "22222", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # solve mode
         solver = Solver()
@@ -93,8 +132,8 @@ class TestSolve:
             "02100",
             "N",
         ]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # solve mode
         solver = Solver()
@@ -115,8 +154,8 @@ class TestPlay:
 
         # mock input
         input_values = ["HIPPY", "TULIP", "HAPPY", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # play mode
         solver = Solver()
@@ -136,8 +175,8 @@ class TestPlay:
 
         # mock input
         input_values = ["HIPPY", "TULIP", "HAPPY", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # play mode
         solver = Solver()
@@ -154,8 +193,8 @@ class TestPlay:
 
         # mock input
         input_values = ["HIPPY", "XCFPT", "HAPPY", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # play mode
         solver = Solver()
@@ -171,8 +210,8 @@ class TestPlay:
 
         # mock input - 6 incorrect guesses
         input_values = ["HIPPY", "GREAT", "BRING", "BRAKE", "BLING", "ALERT", "N"]
-        input_iter = (v for v in input_values)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
+        input_iter = iter(input_values)
+        monkeypatch.setattr(builtins, "input", lambda _: next(input_iter))
 
         # play mode
         solver = Solver()
@@ -213,6 +252,68 @@ class TestTest:
         assert final.guess == "SHAKE"
         assert final.outcome == "22222"
 
+    def test_test_one_no_alphabet(self):
+        "capture_alphabet argument"
+
+        guesses = _test_one(
+            WORDLIST,
+            RuleSet().score_words(WORDLIST, WORDLIST),
+            "SHAKE",
+            capture_alphabet=False,
+        )
+        assert guesses[-1].guess == "SHAKE"
+        assert all(guess.alphabet is None for guess in guesses)
+
+    def test_cached(self, monkeypatch):
+        "_cached() function"
+
+        calls = []
+
+        def func(value):
+            "Records each call"
+            calls.append(value)
+            return value
+
+        # No cache outside worker processes
+        monkeypatch.setattr("wordlesolve.solver._worker_cache", None)
+        assert _cached(("key",), func, 1) == 1
+        assert _cached(("key",), func, 1) == 1
+        assert len(calls) == 2
+
+        # Worker processes call func once per key
+        monkeypatch.setattr("wordlesolve.solver._worker_cache", {})
+        assert _cached(("key",), func, 2) == 2
+        assert _cached(("key",), func, 3) == 2
+        assert _cached(("other",), func, 3) == 3
+        assert calls == [1, 1, 2, 3]
+
+    def test_init_worker(self, monkeypatch):
+        "_init_worker() and _worker_test_one() functions"
+
+        # Restore the module globals afterwards
+        monkeypatch.setattr("wordlesolve.solver._worker_cache", None)
+        monkeypatch.setattr("wordlesolve.solver._worker_test", None)
+
+        _init_worker(lambda solution: [solution])
+        assert solver_module._worker_cache == {}
+        assert _worker_test_one("SHAKE") == ["SHAKE"]
+
+    def test_max_workers(self, monkeypatch):
+        "_max_workers() function"
+
+        monkeypatch.setattr("os.cpu_count", lambda: 64)
+        monkeypatch.setattr("sys.platform", "linux")
+        assert _max_workers(3) == 3
+        assert _max_workers(100) == 64
+
+        # Windows limit
+        monkeypatch.setattr("sys.platform", "win32")
+        assert _max_workers(100) == 61
+
+        # CPU count unknown
+        monkeypatch.setattr("os.cpu_count", lambda: None)
+        assert _max_workers(100) == 1
+
     def test_run_tests(self, capsys):
         "_run_tests() function"
 
@@ -27,10 +27,51 @@ optional arguments:
 """
 
 import argparse
+from functools import cache
 import sys
+from typing import Any, Callable
 
 from wordlesolve import Solver
 
+# Parsed arguments when none are given on the command line
+_DEFAULT_ARGS = {
+    "play": False,
+    "solve": True,
+    "test": False,
+    "guessfreq": None,
+    "solutionfreq": None,
+    "testcount": None,
+    "solutions": None,
+    "file": None,
+    "verbosity": 0,
+    "hard": False,
+}
+
+
+def _upper_words(words: list[str]) -> list[str]:
+    """Returns a list of words in upper case"""
+    return [word.upper() for word in words]
+
+
+# Command line argument: (keyword argument, type conversion)
+_KWARGS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "hard": ("hard", bool),
+    "guessfreq": ("guess_freq", float),
+    "solutionfreq": ("solution_freq", float),
+    "verbosity": ("verbosity", int),
+    "testcount": ("count", int),
+    "solutions": ("solutions", _upper_words),
+    "file": ("filename", str),
+}
+
+# Command line arguments that apply to each mode
+_SOLVE_KEYS = ("hard", "guessfreq")
+_PLAY_KEYS = _SOLVE_KEYS + ("solutionfreq",)
+_TEST_KEYS = _PLAY_KEYS + ("verbosity", "testcount", "solutions", "file")
+
+# Mode (the Solver method name): command line arguments for that mode
+_MODES = {"play": _PLAY_KEYS, "test": _TEST_KEYS, "solve": _SOLVE_KEYS}
+
 
 def main(clargs: argparse.Namespace):
     """Run the Solver
@@ -47,45 +88,18 @@ def main(clargs: argparse.Namespace):
 
     solver = Solver()
 
-    # kwargs from command line
-    kwargs = {"hard": clargs.hard}
-
-    # guess_freq is common to all modes
-    if clargs.guessfreq is not None:
-        kwargs["guess_freq"] = float(clargs.guessfreq)
-
-    # Some args don't apply to solve mode
-    if clargs.play or clargs.test:
-        if clargs.solutionfreq is not None:
-            kwargs["solution_freq"] = float(clargs.solutionfreq)
-
-        # play mode
-        if clargs.play:
-            solver.play(**kwargs)
-
-        # test mode - additional command line arguments
-        else:
-
-            # verbosity
-            kwargs["verbosity"] = int(clargs.verbosity)
-
-            # test coune
-            if clargs.testcount is not None:
-                kwargs["count"] = int(clargs.testcount)
-
-            # solutions
-            if clargs.solutions is not None:
-                kwargs["solutions"] = [word.upper() for word in clargs.solutions]
+    # play / test mode if requested, otherwise solve mode
+    mode = "play" if clargs.play else "test" if clargs.test else "solve"
 
-            # solutions file
-            if clargs.file is not None:
-                kwargs["filename"] = clargs.file
+    # kwargs from those command line arguments that apply to this mode
+    # Arguments not given on the command line are left to the method's defaults
+    kwargs = {
+        _KWARGS[key][0]: _KWARGS[key][1](getattr(clargs, key))
+        for key in _MODES[mode]
+        if getattr(clargs, key) is not None
+    }
 
-            solver.test(**kwargs)
-
-    # solve mode
-    else:
-        solver.solve(**kwargs)
+    getattr(solver, mode)(**kwargs)
 
 
 def parse_args(args: list[str]) -> argparse.Namespace:
@@ -98,6 +112,20 @@ def parse_args(args: list[str]) -> argparse.Namespace:
         Namespace object containing parsed argument data
     """
 
+    # No arguments (the usual case): no need to build the parser
+    if not args:
+        return argparse.Namespace(**_DEFAULT_ARGS)
+
+    return _get_parser().parse_args(args)
+
+
+@cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Returns the command line argument parser
+
+    Built on first use only and then reused.
+    """
+
     # Build command line options
     parser = argparse.ArgumentParser(
         prog="wordlesolve", description="wordlesolve solves Wordle!"
@@ -155,7 +183,7 @@ def parse_args(args: list[str]) -> argparse.Namespace:
     # hard mode
     parser.add_argument("--hard", help="enable hard mode", action="store_true")
 
-    return parser.parse_args(args)
+    return parser
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -12,6 +12,12 @@ Output functions:
     print_alphabet(status, sep=" "): prints the alphabet color-coded by status
     print_word(word, outcome): play mode - print word to terminal
 
+Setup functions:
+    init_console(): initialize colorama (first call only)
+
+Constants:
+    ANSI escape codes BRIGHT, DIM, RESET_ALL, RED, GREEN, YELLOW, WHITE
+
 Input functions:
     get_guess_input(width=0): obtains valid guess from the user
     get_outcome_input(width): obtains valid outcome from the user
@@ -19,19 +25,52 @@ Input functions:
 
 """
 
+from collections import Counter
+from functools import cache, lru_cache
 import string
-from typing import NamedTuple
+import sys
+from typing import NamedTuple, Optional
+
+from .ruleset import ALPHABET, WordScore
+
+# ANSI escape codes, the same as colorama's Style / Fore constants
+# colorama itself is only imported to set up a terminal - see init_console()
+BRIGHT = "\033[1m"
+DIM = "\033[2m"
+RESET_ALL = "\033[0m"
+RED = "\033[31m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+WHITE = "\033[37m"
+
+# Colors indexed by letter status (0/1/2)
+# Unknown status (-1) is the last item so negative indexing picks it up
+COLORS = (BRIGHT + RED, BRIGHT + YELLOW, BRIGHT + GREEN, WHITE)
+
+# Color-coded letters for each (letter, status) combination
+_COLORED_LETTERS = {
+    (letter, status): COLORS[status] + letter
+    for letter in ALPHABET
+    for status in (-1, 0, 1, 2)
+}
 
-import colorama as cr  # type: ignore
+# Play mode letter boxes: the top and bottom rows only depend on the status,
+# the middle row on the (letter, status) combination
+_BORDERS = tuple(color + " --- " for color in COLORS[:3])
+_LETTER_BOXES = {
+    (letter, status): COLORS[status] + f"| {letter} |"
+    for letter in ALPHABET
+    for status in range(3)
+}
 
-from .ruleset import WordScore
+# Input validation tables: translating valid input with these deletes every character
+_YN_TABLE = str.maketrans("", "", "YyNn")
+_GUESS_TABLE = str.maketrans("", "", string.ascii_letters)
+_OUTCOME_TABLE = str.maketrans("", "", "012")
 
-COLORS = {
-    -1: cr.Fore.WHITE,
-    0: cr.Style.BRIGHT + cr.Fore.RED,
-    1: cr.Style.BRIGHT + cr.Fore.YELLOW,
-    2: cr.Style.BRIGHT + cr.Fore.GREEN,
-}
+# Verbose test outcome templates, formatted with a GuessOutcome
+_GUESS_LINES = "Guess:   {0.guess}\nOutcome: {0.outcome}".format
+_MATCHES_LINE = "Matches: {0.match_count} ({1}{2})".format
 
 
 class GuessOutcome(NamedTuple):
@@ -43,12 +82,30 @@ class GuessOutcome(NamedTuple):
     outcome: str  # Outcome string ('01100' etc.)
     matches: list[str]  # First five matches after this guess
     match_count: int  # Total number of matches remaining
-    alphabet: dict[str, int]  # Alphabet status
+    alphabet: Optional[dict[str, int]]  # Alphabet status (None if not captured)
 
 
 TestOutcome = list[GuessOutcome]
 
 
+@cache
+def init_console():
+    """Initialize colorama for console output
+
+    colorama wraps sys.stdout when initialized, so this only
+    needs to happen once however many Solver instances are created.
+
+    If stdout is not a terminal (e.g. redirected or captured)
+    colorama is not even imported and escape codes are written unchanged.
+    So every colored string is followed by RESET_ALL
+    rather than relying on colorama's autoreset.
+    """
+    if sys.stdout is not None and sys.stdout.isatty():
+        import colorama  # type: ignore # pylint: disable=import-outside-toplevel
+
+        colorama.init(autoreset=True)
+
+
 def print_word(word: str, outcome: str):
     """Play mode: print word to terminal
 
@@ -65,38 +122,45 @@ def print_word(word: str, outcome: str):
         outcome: 5-character outcome string e.g. '01210'
 
     """
-    for row in range(3):
-        _print_word_row(word, outcome, row)
+
+    # The top and bottom rows are identical, so only two rows need building
+    # All three rows go out in a single write
+    border = _get_word_row(word, outcome, 0)
+    print(f"{border}\n{_get_word_row(word, outcome, 1)}\n{border}")
 
 
-def _print_word_row(word: str, outcome: str, row: int):
-    """Play mode: print single row for this word
+def _get_word_row(word: str, outcome: str, row: int) -> str:
+    """Play mode: returns single row for this word
 
     Args:
         word: word to print
         outcome: 5-character outcome string e.g. '01210'
         row index to print (0-2)
     """
-    print(
+
+    # Top and bottom rows are the same for every word with this outcome
+    if row != 1:
+        return _get_border_row(outcome)
+
+    # Iterating the outcome as bytes gives ints directly:
+    # subtracting ord("0") turns each one into its status
+    return (
         "  ".join(
-            (
-                _letter_row(letter, int(status), row)
-                for letter, status in zip(word, outcome)
-            )
+            _LETTER_BOXES[letter, status - 48]
+            for letter, status in zip(word, outcome.encode("ascii"))
         )
+        + RESET_ALL
     )
 
 
-def _letter_row(letter: str, status: int, row: int) -> str:
-    """Play mode: returns single row for a single letter
+@cache
+def _get_border_row(outcome: str) -> str:
+    """Play mode: returns the top / bottom row for a word with this outcome
 
     Args:
-        letter: letter to print
-        status: outcome status (0/1/2)
-        row: row index to print (0-2)
-
+        outcome: 5-character outcome string e.g. '01210'
     """
-    return COLORS[status] + (f"| {letter} |" if row == 1 else " --- ")
+    return "  ".join(_BORDERS[int(status)] for status in outcome) + RESET_ALL
 
 
 def print_alphabet(status: dict[str, int], sep: str = " "):
@@ -132,8 +196,25 @@ def get_printable_alphabet(status: dict[str, int], sep: str = " ") -> str:
             string to place between letters (default is ASCII space)
     """
 
-    return sep.join(
-        ((COLORS[status[letter]] + letter) for letter in string.ascii_uppercase)
+    # The same few alphabet states come up again and again
+    # (e.g. for each test solve's first guess), so the strings are cached
+    return _printable_alphabet(tuple(status[letter] for letter in ALPHABET), sep)
+
+
+@lru_cache(maxsize=1024)
+def _printable_alphabet(statuses: tuple[int, ...], sep: str) -> str:
+    """Returns the alphabet color-coded by status
+
+    Args:
+        statuses: status of each letter, in alphabetical order
+        sep: string to place between letters
+    """
+    return (
+        sep.join(
+            _COLORED_LETTERS[letter, status]
+            for letter, status in zip(ALPHABET, statuses)
+        )
+        + RESET_ALL
     )
 
 
@@ -150,56 +231,66 @@ def display_test_outcomes(
     """
 
     # Get the tally of guesses taken
-    guess_counter = {value: 0 for value in range(1, 7)}
-    unsolved = []
-    for word, guesses in outcomes.items():
-        if guesses[-1].guess == word:
-            guess_counter[len(guesses)] += 1
-        else:
-            unsolved.append(word)
-
-    # Print test output
-    print()
-    print(f"Words tested: {len(outcomes)}{' (hard mode)' if hard else ''}")
-    print(f"Total time:   {int(time/60):02d}:{int(time % 60):02d}")
-    print()
-
-    # Print tally of number of guesses required to solve
-    # Right-align values and percentages
+    unsolved = [word for word, guesses in outcomes.items() if guesses[-1].guess != word]
+    tally = Counter(
+        len(guesses) for word, guesses in outcomes.items() if guesses[-1].guess == word
+    )
+    guess_counter = {value: tally[value] for value in range(1, 7)}
+
+    # Output is collected line by line and printed in one go at the end
+    lines = [""]
+
+    # Test summary
+    total = len(outcomes)
+    lines.append(f"Words tested: {total}{' (hard mode)' if hard else ''}")
+    lines.append(f"Total time:   {int(time/60):02d}:{int(time % 60):02d}")
+    lines.append("")
+
+    # Tally of number of guesses required to solve
+    # Right-align values and (whole number) percentages
     maxval = max(guess_counter.values())
     maxlenv = len(str(maxval))
-    maxlenp = len(str(int(maxval * 100 / len(outcomes))))
+    maxlenp = len(str(maxval * 100 // total))
 
-    # Print guess tally
+    # Guess tally
     for key, value in guess_counter.items():
-        percent = f"[{str(int(value*100/len(outcomes))).rjust(maxlenp)}%]"
-        print(f"Solved in {key}:  {str(value).rjust(maxlenv)} {percent}")
+        lines.append(
+            f"Solved in {key}:  {value:>{maxlenv}} [{value * 100 // total:>{maxlenp}}%]"
+        )
 
-    # Print unsolved total and words
-    percent = f"[{str(int(len(unsolved)*100/len(outcomes))).rjust(maxlenp)}%]"
-    print(f"Unsolved:     {str(len(unsolved)).rjust(maxlenv)} {percent}")
+    # Unsolved total and words
+    count = len(unsolved)
+    lines.append(
+        f"Unsolved:     {count:>{maxlenv}} [{count * 100 // total:>{maxlenp}}%]"
+    )
     if unsolved and verbosity == 0:
-        print(f"Unsolved:     {', '.join(sorted(unsolved))}")
+        lines.append(f"Unsolved:     {', '.join(sorted(unsolved))}")
 
     # More detailed output as required
     if verbosity:
-        _verbose_test_outcomes(outcomes, unsolved, verbosity)
+        lines += _verbose_test_outcomes(outcomes, unsolved, verbosity)
+
+    lines.append("\n")
 
-    print("\n")
+    print("\n".join(lines))
 
 
 def _verbose_test_outcomes(
     outcomes: dict[str, TestOutcome], unsolved: list[str], verbosity: int
-):
-    """Display verbose test outcome
+) -> list[str]:
+    """Returns the lines of verbose test outcome output
 
     Args:
         outcomes: test outcomes data
         unsolved: list of unsolved words
         verbosity: level of output (1 or 2)
+
+    Returns:
+        list of lines to display
     """
 
-    print()
+    lines = [""]
+    sep_join = ", ".join
 
     # Verbosity >= 1: show guesses for each word
     for word in sorted(outcomes.keys()):
@@ -207,57 +298,51 @@ def _verbose_test_outcomes(
         outcome_str = (
             "not solved" if word in unsolved else f"solved in {len(guesses)} guesses"
         )
-        guess_list = ", ".join(guess.guess for guess in guesses)
-        print(
-            f"{cr.Fore.GREEN}{word}{cr.Style.RESET_ALL}: {outcome_str} ({guess_list})"
-        )
+        guess_list = sep_join(guess.guess for guess in guesses)
+        lines.append(f"{GREEN}{word}{RESET_ALL}: {outcome_str} ({guess_list})")
 
         # Verbosity == 2: list out matches and scores
         if verbosity > 1:
             for guess_number, guess in enumerate(guesses):
-                print()
+                lines.append("")
 
                 # Guess number
-                print(f"Guess {guess_number+1}")
-                score_str = ", ".join(
-                    [
-                        score[0]
-                        + " ("
-                        + str(score[1])
-                        + ("/" + str(score[2]) if score[2] else "")
-                        + ")"
-                        for score in guess.scores
-                    ]
+                lines.append(f"Guess {guess_number+1}")
+                score_str = sep_join(
+                    f"{word} ({score}/{freq})" if freq else f"{word} ({score})"
+                    for word, score, freq in guess.scores
                 )
 
                 # Word scores
-                print(
+                lines.append(
                     "Scores:  "
                     + score_str
                     + (", ..." if guess.score_count > len(guess.scores) else "")
                 )
 
                 # Guess and outcome
-                print("Guess:   " + guess.guess)
-                print("Outcome: " + guess.outcome)
+                lines.append(_GUESS_LINES(guess))
 
                 # If not correctly guessed show remaining matches and alphabet status
                 if guess.outcome != "22222":
 
                     # Matches
-                    print(
-                        "Matches: "
-                        + str(guess.match_count)
-                        + " ("
-                        + ", ".join((match for match in guess.matches))
-                        + (", ..." if guess.match_count > len(guess.matches) else "")
-                        + ")"
+                    lines.append(
+                        _MATCHES_LINE(
+                            guess,
+                            sep_join(guess.matches),
+                            ", ..." if guess.match_count > len(guess.matches) else "",
+                        )
                     )
 
-                    # Alphabet
-                    print("Letters: " + get_printable_alphabet(guess.alphabet))
+                    # Alphabet - only captured for verbosity 2 (see Solver.test())
+                    if guess.alphabet is not None:
+                        alphabet = get_printable_alphabet(guess.alphabet)
+                        lines.append("Letters: " + alphabet)
+
+            lines.append("\n")
 
-            print("\n")
+    return lines
 
 
 def get_yn_input(prompt: str) -> str:
@@ -279,7 +364,7 @@ def get_yn_input(prompt: str) -> str:
         response = input(prompt)
 
         # Return if valid
-        if _validate_input(response, 1, "YyNn"):
+        if _validate_input(response, 1, _YN_TABLE):
             return response.upper()
 
 
@@ -302,7 +387,7 @@ def get_guess_input(width: int = 0) -> str:
         guess = input(("Your guess: ").ljust(width))
 
         # Return if valid
-        if _validate_input(guess, 5, string.ascii_letters):
+        if _validate_input(guess, 5, _GUESS_TABLE):
             return guess.upper()
 
         # Help text if invalid
@@ -328,23 +413,26 @@ def get_outcome_input(width: int) -> str:
         outcome = input(("Outcome:").ljust(width))
 
         # Return if valid
-        if _validate_input(outcome, 5, "012"):
+        if _validate_input(outcome, 5, _OUTCOME_TABLE):
             return outcome
 
         # Help text if invalid
         print("2 = green | 1 = yellow | 0 = grey")
 
 
-def _validate_input(user_input: str, length: int, valid_chars: str) -> bool:
+def _validate_input(
+    user_input: str, length: int, table: dict[int, Optional[int]]
+) -> bool:
     """Validates user input
 
     Args:
         user_input: input string to validate
         length: acceptable length
-        valid_chars: acceptable characters
+        table: translation table deleting every acceptable character
 
     Returns True if user_input is valid, False otherwise.
     """
-    return len(user_input) == length and all(
-        letter in valid_chars for letter in user_input
-    )
+
+    # Cheap length check first, then delete every valid character:
+    # nothing should be left behind
+    return len(user_input) == length and not user_input.translate(table)
@@ -1,5 +1,8 @@
 """RuleSet and associated classes
 
+Constants:
+    ALPHABET - tuple of upper case letters A-Z
+
 Classes:
     Rule - rule for a letter of the alphabet
     RuleSet - set of rules for this Wordle game
@@ -42,7 +45,10 @@ RuleSet methods:
     .get_alphabet_status(): returns a dict showing the status of each letter of the alphabet.
     .is_match(word): check whether a word matches this RuleSet
     .filter_matches(words): filter a list of words to retain only RuleSet matches
-    .score_words(words, matches): score a list of words according to this RuleSet
+    .score_words(words, matches, top_k=None): score a list of words according to this RuleSet
+
+Module functions:
+    index_words(words): build cached per-word data ahead of filtering / scoring
 
 RuleSet.score_words(words, matches) returns an instance of the WordScore class.
 WordScore is a subclass of NamedTuple with attributes:
@@ -54,12 +60,38 @@ WordScore is a subclass of NamedTuple with attributes:
 
 from collections import Counter
 from dataclasses import dataclass, field
+import heapq
 from operator import itemgetter
+import re
 import string
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 from wordfreq import zipf_frequency  # type: ignore
 
+# Upper case letters as a tuple of single-character strings
+ALPHABET = tuple(string.ascii_uppercase)
+
+# One bit per letter: A = 1, B = 2, C = 4 etc.
+_LETTER_BITS = {letter: 1 << index for index, letter in enumerate(ALPHABET)}
+
+# Cache of letter bitmasks for each word seen
+_WORD_MASKS: dict[str, int] = {}
+
+# When scoring, frequency and position scores are combined in one flat table
+# with an entry for each (letter, occurrence, position):
+# the nth occurrence of a letter in a given position scores
+# the letter's nth frequency score plus its score for that position
+# Each letter has 25 entries (5 occurrences x 5 positions) starting at this offset
+_SCORE_OFFSETS = {letter: index * 25 for index, letter in enumerate(ALPHABET)}
+
+# Cache of score table indices for each word seen
+_WORD_INDICES: dict[str, tuple[int, ...]] = {}
+
+# Cache of letter occurrences for each word seen, one character for each
+# (letter, occurrence) pair: the first occurrence of a letter is the letter itself,
+# later occurrences are shifted 26 characters along for each previous one
+_WORD_OCCURRENCES: dict[str, str] = {}
+
 
 @dataclass
 class Rule:
@@ -110,6 +142,9 @@ class RuleSet(dict):
     is the Rule corresponding to that letter
     """
 
+    # All state lives in the dict itself - no per-instance __dict__ needed
+    __slots__ = ()
+
     def add_outcome(self, guess: str, outcome: str):
         """Adds an outcome to the ruleset
 
@@ -122,36 +157,36 @@ class RuleSet(dict):
                      '2' = letter present and in correct position
         """
 
-        # Get count of letters
-        counts = {letter: 0 for letter in set(guess)}
-        for letter, result in zip(guess, outcome):
-            if result in ("1", "2"):
-                counts[letter] += 1
+        # Count of each letter found present in the solution
+        counts = dict.fromkeys(guess, 0)
 
-        # Add to ruleset
-        for letter, count in counts.items():
+        # Add positions to ruleset - a single pass over the outcome
+        for position, (letter, result) in enumerate(zip(guess, outcome)):
 
             # Create rule if not already there
-            if letter not in self:
-                self[letter] = Rule()
-
-            # Increase letter count if applicable
-            self[letter].count = max(self[letter].count, count)
-
-        # Add positions to ruleset
-        for letter, result, position in zip(guess, outcome, range(5)):
+            rule = self.get(letter)
+            if rule is None:
+                rule = self[letter] = Rule()
 
             # 0 means we know the maximum occurrences there can be of this letter
             if result == "0":
-                self[letter].count_op = "eq"
+                rule.count_op = "eq"
+                continue
+
+            counts[letter] += 1
 
             # 1 means the letter cannot be in this position
-            elif result == "1":
-                self[letter].excluded.add(position)
+            if result == "1":
+                rule.excluded.add(position)
 
             # 2 means the letter must be in this position
             else:
-                self[letter].confirmed.add(position)
+                rule.confirmed.add(position)
+
+        # Increase letter counts if applicable
+        for letter, count in counts.items():
+            rule = self[letter]
+            rule.count = max(rule.count, count)
 
     def is_match(self, word: str) -> bool:
         """Checks whether a word matches this rule set
@@ -197,6 +232,9 @@ class RuleSet(dict):
     def filter_matches(self, words: list[str]) -> list[str]:
         """Filters a list of words to retain only ruleset matches
 
+        Adding outcomes only ever narrows the matches, so after each outcome
+        pass in the previous matches rather than the full word list.
+
         Args:
             words: list of words to filter
 
@@ -204,15 +242,90 @@ class RuleSet(dict):
             list of those words matching this ruleset
         """
 
-        return [word for word in words if self.is_match(word)]
+        # Letters that must / must not appear as bitmasks
+        # Most words fail on one of these, so they are checked first
+        # and only the survivors go through the full is_match()
+        required = forbidden = 0
+        try:
+            for letter, rule in self.items():
+                if rule.count:
+                    required |= _LETTER_BITS[letter]
+                else:
+                    forbidden |= _LETTER_BITS[letter]
+
+            masks = _letter_masks(words)
+
+        # Only A-Z have bitmasks: anything else falls back to is_match()
+        except KeyError:
+            return [word for word in words if self.is_match(word)]
+
+        # The rest of is_match() is done by a regular expression
+        match = self._get_pattern().fullmatch
+
+        return [
+            word
+            for word, mask in zip(words, masks)
+            if mask & required == required and not mask & forbidden and match(word)
+        ]
+
+    def _get_pattern(self) -> re.Pattern:
+        """Compiles this RuleSet into a regular expression
 
-    def score_words(self, words: list[str], matches: list[str]) -> list[WordScore]:
+        A word matches the pattern (with fullmatch) exactly when is_match() is True.
+        The pattern starts with a lookahead for each letter count,
+        followed by the letters allowed in each of the five positions.
+
+        E.g. guess BRAKE and outcome 01200 gives:
+            (?=(?:[^R]*R){1})(?=(?:[^A]*A){1})[^BKE][^BRKE]A[^BKE][^BKE]
+
+        Returns:
+            compiled regular expression
+        """
+
+        # Letter counts: at least / exactly count occurrences
+        parts = []
+        for letter, rule in self.items():
+            if rule.count:
+                other = f"[^{letter}]*"
+                parts.append(
+                    f"(?=(?:{other}{letter}){{{rule.count}}}"
+                    + (f"{other}$)" if rule.count_op == "eq" else ")")
+                )
+
+        # Letters allowed in each position
+        for position in range(5):
+            banned = "".join(
+                letter
+                for letter, rule in self.items()
+                if not rule.count or position in rule.excluded
+            )
+            confirmed = [
+                letter for letter, rule in self.items() if position in rule.confirmed
+            ]
+
+            # A confirmed letter is the only one allowed
+            # Conflicting rules (only possible from mistyped outcomes) never match
+            if confirmed:
+                if len(confirmed) == 1 and confirmed[0] not in banned:
+                    parts.append(confirmed[0])
+                else:
+                    parts.append("(?!)")
+            else:
+                parts.append(f"[^{banned}]" if banned else ".")
+
+        # re caches compiled patterns, so repeat calls are cheap
+        return re.compile("".join(parts))
+
+    def score_words(
+        self, words: list[str], matches: list[str], top_k: Optional[int] = None
+    ) -> list[WordScore]:
         """
         Score a list of words according to this RuleSet
 
         Args:
             words: words to score
             matches: matches to current RuleSet
+            top_k: if given, return only this many of the highest scoring words
 
         Returns:
             list of WordScores ordered from highest to lowest score
@@ -226,33 +339,43 @@ class RuleSet(dict):
         # otherwise score the whole list
         words_to_score = matches if len(matches) < 3 else words
 
-        # Get word scores
+        # Get (word, score) pairs
+        # WordScores are only created for the words returned
         word_scores = _score_words(words_to_score, fscores, pscores)
 
+        # Only the top_k are wanted: just keep the words scoring at least
+        # as much as the top_k'th (or the fifth, as the top five are tie-broken)
+        # rather than sorting the whole list
+        keep = max(top_k or 0, 5)
+        if top_k is not None and len(word_scores) > keep:
+            threshold = heapq.nlargest(keep, map(itemgetter(1), word_scores))[-1]
+            word_scores = [score for score in word_scores if score[1] >= threshold]
+
         # Order by score
         word_scores.sort(key=itemgetter(1), reverse=True)
 
         # Word frequency breaks tie for words as far as fifth position
-        previous = 0
-        for index, word_score in enumerate(word_scores):
-
-            # Loop at least to the fifth word
-            # and then until the score changes
-            if index > 4 and word_score.score != previous:
-                break
-
-            # Add word frequency to the score
-            new_score = word_score._replace(
-                frequency=zipf_frequency(word_score.word, "en")
-            )
-            word_scores[index] = new_score
-            previous = word_score.score
+        # Go at least to the fifth word and then until the score changes
+        tied = 5
+        while (
+            tied < len(word_scores) and word_scores[tied][1] == word_scores[tied - 1][1]
+        ):
+            tied += 1
+
+        # Add word frequency to the score
+        top = [
+            WordScore(word, score, zipf_frequency(word, "en"))
+            for word, score, *_ in word_scores[:tied]
+        ]
 
         # Order again by word frequency and then by score
-        word_scores.sort(key=itemgetter(2), reverse=True)
-        word_scores.sort(key=itemgetter(1), reverse=True)
+        top.sort(key=itemgetter(2), reverse=True)
+        top.sort(key=itemgetter(1), reverse=True)
 
-        return word_scores
+        # The remaining words are already in order and have no frequency
+        rest = [WordScore(word, score) for word, score, *_ in word_scores[tied:top_k]]
+
+        return (top + rest)[:top_k]
 
     def get_alphabet_status(self) -> dict[str, int]:
         """Returns a dict showing the status of each letter of the alphabet.
@@ -264,9 +387,7 @@ class RuleSet(dict):
              1: letter is known to be in the solution but its position is not known
              2: letter is known to be in the solution and its position is also known
         """
-        return {
-            letter: self._get_letter_status(letter) for letter in string.ascii_uppercase
-        }
+        return {letter: self._get_letter_status(letter) for letter in ALPHABET}
 
     def _get_letter_status(self, letter) -> int:
         """Returns the status of a single letter.
@@ -311,7 +432,7 @@ class RuleSet(dict):
         """
         mask = {}
 
-        for letter in string.ascii_uppercase:
+        for letter in ALPHABET:
 
             # Is there a rule for this letter?
             if letter in self:
@@ -351,7 +472,7 @@ class RuleSet(dict):
         """
         mask = {}
 
-        for letter in string.ascii_uppercase:
+        for letter in ALPHABET:
 
             # Is there a rule for this letter?
             if letter in self:
@@ -395,33 +516,17 @@ class RuleSet(dict):
             }
         """
 
-        # Get mask
-        mask = self._get_frequency_mask()
-
         # Initialize count dict
-        frequency_scores = {
-            letter: [0, 0, 0, 0, 0] for letter in string.ascii_uppercase
-        }
-
-        # Iterate over word list
-        for word in words:
-
-            # Count of letter occurrences
-            counter = Counter(word)
-
-            # Increment tally for each letter in the word
-            for letter, count in counter.items():
+        frequency_scores = {letter: [0, 0, 0, 0, 0] for letter in ALPHABET}
 
-                # Increment letter[0] for first occurence, letter[1] for second etc.
-                for index in range(count):
+        # Count every word's (letter, occurrence) pairs in one go
+        # A word with two Bs counts towards B[0] and B[1], etc.
+        for char, count in Counter("".join(_occurrences(words))).items():
+            index, letter = divmod(ord(char) - ord("A"), 26)
+            frequency_scores[ALPHABET[letter]][index] = count
 
-                    # Check for inclusion
-                    if mask[letter][index]:
-
-                        # Increment if included
-                        frequency_scores[letter][index] += 1
-
-        return frequency_scores
+        # Apply the mask once to the totals rather than to every word
+        return _apply_mask(frequency_scores, self._get_frequency_mask())
 
     def _get_position_scores(self, words: list[str]) -> dict[str, list[int]]:
         """Returns dict of letter position scores in word list
@@ -439,55 +544,168 @@ class RuleSet(dict):
             {'A': [1, 0, 0, 0, 0], 'B': [0, 1, 1, 0, 0], ...}
         """
 
-        # Get mask
-        mask = self._get_position_mask()
-
         # Initialize count dict
-        position_scores = {letter: [0, 0, 0, 0, 0] for letter in string.ascii_uppercase}
+        position_scores = {letter: [0, 0, 0, 0, 0] for letter in ALPHABET}
 
-        # Iterate over word list
-        for word in words:
+        # Count each position's letters in one go:
+        # with the words joined up, every fifth character is in the same position
+        joined = "".join(words)
+        for index in range(5):
+            for letter, count in Counter(joined[index::5]).items():
+                position_scores[letter][index] = count
 
-            # Increment score for each letter in the word
-            for index, letter in enumerate(word):
-                position_scores[letter][index] += mask[letter][index]
+        # Apply the mask once to the totals rather than to every word
+        return _apply_mask(position_scores, self._get_position_mask())
 
-        return position_scores
+
+def _apply_mask(
+    scores: dict[str, list[int]], mask: dict[str, list[int]]
+) -> dict[str, list[int]]:
+    """Applies a frequency or position mask to a set of scores
+
+    Args:
+        scores: score dict with format {letter: [score1, ..., score5]}
+        mask: mask dict in the same format, 1 = score, 0 = do not score
+
+    Returns:
+        dict of scores with masked values set to zero
+    """
+    return {
+        letter: [
+            score * include for score, include in zip(scores[letter], mask[letter])
+        ]
+        for letter in ALPHABET
+    }
 
 
 def _score_words(
     words: list[str],
     fscores: dict[str, list[int]],
     pscores: dict[str, list[int]],
-) -> list[WordScore]:
+) -> list[tuple[str, int]]:
     """Score words as per given frequency and positio scores
 
+    Plain tuples are much cheaper to create than WordScores,
+    and most words scored are never returned by RuleSet.score_words()
+
     Args:
         words: list of words to score
         fscores: frequency score dict for each letter
         pscores; position score dict for each letter
 
     Returns:
-        list of WordScores for this list of words
+        list of (word, score) tuples for this list of words
+    """
+
+    # Combine the scores into a single table
+    table = [
+        fscore + pscore
+        for letter in ALPHABET
+        for fscore in fscores[letter]
+        for pscore in pscores[letter]
+    ]
+
+    # Each word's score is the sum of its five entries in the table, one per letter
+    return [
+        (word, table[a] + table[b] + table[c] + table[d] + table[e])
+        for word, (a, b, c, d, e) in zip(words, _score_indices(words))
+    ]
+
+
+def index_words(words: list[str]):
+    """Builds the cached letter masks, score indices and occurrences for a list of words
+
+    These are otherwise built the first time each word is filtered or scored.
+    Building them up front means that processes forked afterwards
+    (e.g. test mode workers) start with them ready to use.
+
+    Args:
+        words: list of words
     """
+    _letter_masks(words)
+    _score_indices(words)
+    _occurrences(words)
+
+
+def _letter_masks(words: list[str]) -> list[int]:
+    """Returns the letter bitmask for each word
 
-    word_scores = []
+    The bitmask has one bit set for each letter in the word
+    (see _LETTER_BITS). Masks are cached as the same word list
+    is filtered again and again.
+
+    Args:
+        words: list of words
 
-    # Score each word
+    Returns:
+        list of bitmasks, in the same order as words
+    """
+    masks = []
     for word in words:
+        mask = _WORD_MASKS.get(word)
+        if mask is None:
+            mask = 0
+            for letter in word:
+                mask |= _LETTER_BITS[letter]
+            _WORD_MASKS[word] = mask
+        masks.append(mask)
 
-        score = 0
+    return masks
 
-        # Frequency score
-        counter = Counter(word)
-        for letter, count in counter.items():
-            for index in range(count):
-                score += fscores[letter][index]
 
-        # Position score
-        for position, letter in enumerate(word):
-            score += pscores[letter][position]
+def _score_indices(words: list[str]) -> list[tuple[int, ...]]:
+    """Returns the score table indices for each word
+
+    Each word has five entries in the flat score table used by _score_words():
+    one per letter, combining its frequency score and its position score.
+    Indices are cached as the same words are scored again and again.
+
+    Args:
+        words: list of words
+
+    Returns:
+        list of tuples of five indices, in the same order as words
+    """
+    indices = []
+    for word in words:
+        word_indices = _WORD_INDICES.get(word)
+        if word_indices is None:
+            word_indices = tuple(
+                # The occurrence index of this letter is the number of times
+                # it has already appeared in the word
+                # (0 for the first occurrence, 1 for the second etc.)
+                _SCORE_OFFSETS[letter] + word.count(letter, 0, position) * 5 + position
+                for position, letter in enumerate(word)
+            )
+            _WORD_INDICES[word] = word_indices
+        indices.append(word_indices)
 
-        word_scores.append(WordScore(word, score))
+    return indices
+
+
+def _occurrences(words: list[str]) -> list[str]:
+    """Returns the letter occurrences of each word
+
+    Each word has five characters, one per letter,
+    identifying the letter and its occurrence index
+    (0 for the first occurrence, 1 for the second etc.)
+    See _WORD_OCCURRENCES above.
+
+    Args:
+        words: list of words
+
+    Returns:
+        list of five-character strings, in the same order as words
+    """
+    occurrences = []
+    for word in words:
+        word_occurrences = _WORD_OCCURRENCES.get(word)
+        if word_occurrences is None:
+            word_occurrences = "".join(
+                chr(ord(letter) + 26 * word.count(letter, 0, position))
+                for position, letter in enumerate(word)
+            )
+            _WORD_OCCURRENCES[word] = word_occurrences
+        occurrences.append(word_occurrences)
 
-    return word_scores
+    return occurrences
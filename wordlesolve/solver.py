@@ -20,29 +20,47 @@ Has 3 public methods:
 
 
 """
+from bisect import bisect_right
 from concurrent.futures import ProcessPoolExecutor
 import datetime as dt
 from functools import partial
+import multiprocessing as mp
+import os
 import random
 import string
-from typing import Optional
+import sys
+from typing import Any, Callable, Optional
 
-import colorama as cr  # type: ignore
 from wordfreq import zipf_frequency  # type: ignore
 
 from .console import (
+    BRIGHT,
+    DIM,
     display_test_outcomes,
     get_guess_input,
     get_outcome_input,
     get_yn_input,
     GuessOutcome,
+    init_console,
     print_alphabet,
     print_word,
+    RED,
+    RESET_ALL,
     TestOutcome,
 )
-from .ruleset import RuleSet, WordScore
+from .ruleset import index_words, RuleSet, WordScore
 from .wordlist import WORDLIST
 
+# Deletes letters - a valid word is left empty by str.translate()
+_LETTERS_TABLE = str.maketrans("", "", string.ascii_letters)
+
+# Test mode cache, only set up in worker processes - see _init_worker()
+_worker_cache: Optional[dict[tuple, Any]] = None  # pylint: disable=invalid-name
+
+# Test solve function, only set up in worker processes - see _init_worker()
+# pylint: disable-next=invalid-name
+_worker_test: Optional[Callable[[str], TestOutcome]] = None
+
 
 class Solver:
     """Main Wordle Solver class."""
@@ -50,7 +68,17 @@ class Solver:
     def __init__(self):
         """Initialize Solver class"""
         self.words = WORDLIST
-        cr.init(autoreset=True)
+
+        # Word frequencies from most to least frequent, negated for bisect()
+        # and the index of each word in self.words in the same order
+        # Only looked up when first needed - see _filter_words()
+        self._frequencies: list[float] = []
+        self._frequency_order: list[int] = []
+
+        # Filtered word lists by minimum frequency - see _filter_words()
+        self._filtered: dict[float, list[str]] = {}
+
+        init_console()
 
     def solve(self, guess_freq: float = 1.17, hard: bool = False):
         """Run solve mode
@@ -67,13 +95,20 @@ class Solver:
         # Get the master word list
         words = self._filter_words(guess_freq)
 
+        # Get word scores for the first guess (this will be the same for every puzzle)
+        # The same RuleSet is then cleared and reused for each puzzle
+        # Only the top five scores are suggested
+        rule_set = RuleSet()
+        init_scores = rule_set.score_words(words, words, top_k=5)
+
         while True:
             print("\n")
             print("Wordle Solver")
             print("-------------")
             print(
-                cr.Style.DIM
+                DIM
                 + "Original game at https://www.nytimes.com/games/wordle/index.html"
+                + RESET_ALL
             )
             if hard:
                 print("[Hard mode]")
@@ -81,13 +116,19 @@ class Solver:
 
             # Initial match list is full word list
             matches = words
-            rule_set = RuleSet()
+            rule_set.clear()
 
             for guess_number in range(1, 7):
 
                 # Get the scored word list
+                if guess_number == 1:
+                    word_scores = init_scores
+
                 # In hard mode score only matches, otherwise score all words
-                word_scores = rule_set.score_words(matches if hard else words, matches)
+                else:
+                    word_scores = rule_set.score_words(
+                        matches if hard else words, matches, top_k=5
+                    )
 
                 print(f"Guess number {guess_number}")
 
@@ -97,8 +138,7 @@ class Solver:
                 # (or the user entered an outcome incorrectly)
                 if word_scores:
                     print(
-                        "Suggestions: "
-                        + ", ".join((score[0] for score in word_scores[:5]))
+                        "Suggestions: " + ", ".join(score[0] for score in word_scores)
                     )
                 else:
                     print("Sorry - I don't have any suggestions for you!")
@@ -140,24 +180,29 @@ class Solver:
 
         """
 
-        # Get the master word list
+        # Get the master word list and the list of possible solutions
         words = self._filter_words(guess_freq)
+        solutions = self._filter_words(solution_freq)
+
+        # RuleSet reused for each game
+        rule_set = RuleSet()
 
         while True:
 
             # Get a solution to find
-            solution = random.choice(self._filter_words(solution_freq))
+            solution = random.choice(solutions)
 
-            # Initialize RuleSet
-            rule_set = RuleSet()
+            # Clear rules from any previous game
+            rule_set.clear()
 
             # Print header
             print("\n")
             print("WORDLE")
             print("------")
             print(
-                cr.Style.DIM
+                DIM
                 + "Original game at https://www.nytimes.com/games/wordle/index.html"
+                + RESET_ALL
             )
             if hard:
                 print("[Hard mode]")
@@ -208,7 +253,7 @@ class Solver:
 
             # Solution not found
             else:
-                print("The correct answer was: " + cr.Style.BRIGHT + solution)
+                print("The correct answer was: " + BRIGHT + solution + RESET_ALL)
                 print("Better luck next time!\n")
 
             # Play again?
@@ -279,45 +324,30 @@ class Solver:
             solutions = [
                 word.upper()
                 for word in solutions
-                if len(word) == 5
-                and all(letter in string.ascii_letters for letter in word)
+                if len(word) == 5 and not word.translate(_LETTERS_TABLE)
             ]
 
         else:
             # Solutions from file
             if filename is not None:
                 try:
+                    # Read the whole file in one call rather than line by line
+                    # Validate words and add to solutions list
                     with open(filename, encoding="utf-8") as file:
-
-                        # Validate words and add to solutions list
                         solutions = [
                             word[:5].upper()
-                            for word in file
-                            if (
-                                len(word) >= 5
-                                and all(
-                                    letter in string.ascii_letters
-                                    for letter in word[:5]
-                                )
-                            )
+                            for word in file.read().split("\n")
+                            if len(word) >= 5 and not word[:5].translate(_LETTERS_TABLE)
                         ]
 
                 # Manage file error
                 except OSError:
-                    print(
-                        cr.Style.BRIGHT
-                        + cr.Fore.RED
-                        + "Unable to read solutions file\n"
-                    )
+                    print(f"{BRIGHT}{RED}Unable to read solutions file{RESET_ALL}\n")
 
                 # Manage invalid or empty file
                 else:
                     if not solutions:
-                        print(
-                            cr.Style.BRIGHT
-                            + cr.Fore.RED
-                            + "File has no valid solutions"
-                        )
+                        print(BRIGHT + RED + "File has no valid solutions" + RESET_ALL)
 
         # Generate solutions from word list
         if not solutions:
@@ -329,7 +359,10 @@ class Solver:
         start = dt.datetime.now()
 
         # Run tests
-        outcomes = _run_tests(words, solutions, hard)
+        # The alphabet status of each guess is only shown at verbosity 2
+        outcomes = _run_tests(
+            words, solutions, hard, capture_alphabet=retval or verbosity > 1
+        )
 
         # Stop timer
         end = dt.datetime.now()
@@ -349,12 +382,38 @@ class Solver:
             freq: minimum frequency to include
 
         Returns the new list of words.
+        This is cached for each frequency so must not be modified.
         """
-        return [
-            word
-            for word in self.words
-            if (freq == 0.0 or zipf_frequency(word, "en") >= freq)
-        ]
+        if freq not in self._filtered:
+            self._filtered[freq] = self._frequency_filter(freq)
+
+        return self._filtered[freq]
+
+    def _frequency_filter(self, freq: float) -> list[str]:
+        """Filters the master word list to the given frequency (uncached)
+
+        Args:
+            freq: minimum frequency to include
+
+        Returns the new list of words.
+        """
+        if freq == 0.0:
+            return list(self.words)
+
+        # Look up every word's frequency once and sort
+        if not self._frequency_order:
+            by_frequency = sorted(
+                (-zipf_frequency(word, "en"), index)
+                for index, word in enumerate(self.words)
+            )
+            self._frequencies = [frequency for frequency, _ in by_frequency]
+            self._frequency_order = [index for _, index in by_frequency]
+
+        # Words at or above the minimum frequency are at the start of the sorted list
+        count = bisect_right(self._frequencies, -freq)
+
+        # Return them in their original order
+        return [self.words[index] for index in sorted(self._frequency_order[:count])]
 
 
 def _get_outcome(guess: str, solution: str) -> str:
@@ -371,42 +430,41 @@ def _get_outcome(guess: str, solution: str) -> str:
             '2' = letter present and in correct position
     """
 
-    # We use lists to have mutable objects to work with
-    outcome = list("-----")
-    guess_list = list(guess)
-    solution_list = list(solution)
+    # Correct guess - nothing to work out
+    if guess == solution:
+        return "22222"
+
+    # Every letter is 0 (not present) until shown otherwise
+    outcome = ["0"] * 5
+
+    # Letters of the solution not yet matched by a letter of the guess
+    remaining = ""
 
-    # Get 0 and 2 first - this manages multiple occurrences of the same letter
+    # Get 2 first - this manages multiple occurrences of the same letter
     # whereby a letter in the correct position should take precedence
     # over one not in the correct position
     for position in range(5):
-
-        # Letter not present = 0
-        if guess_list[position] not in solution_list:
-            outcome[position] = "0"
-            guess_list[position] = "-"
-
-        # Letter in correct position = 2
-        elif guess_list[position] == solution_list[position]:
+        if guess[position] == solution[position]:
             outcome[position] = "2"
-            solution_list[position] = "-"
-            guess_list[position] = "-"
+        else:
+            remaining += solution[position]
 
-    # Now mop up remaining letters
+    # Now mop up remaining letters - each unmatched letter of the solution
+    # can turn at most one letter of the guess to 1
     for position in range(5):
-        if guess_list[position] != "-":
-            if guess_list[position] not in solution_list:
-                outcome[position] = "0"
-
-            else:
-                outcome[position] = "1"
-                solution_list[solution_list.index(guess_list[position])] = "-"
+        letter = guess[position]
+        if outcome[position] == "0" and letter in remaining:
+            outcome[position] = "1"
+            remaining = remaining.replace(letter, "", 1)
 
     return "".join(outcome)
 
 
 def _run_tests(
-    words: list[str], solutions: list[str], hard: bool
+    words: list[str],
+    solutions: list[str],
+    hard: bool,
+    capture_alphabet: bool = True,
 ) -> dict[str, TestOutcome]:
     """Run a set of test solves
 
@@ -414,39 +472,70 @@ def _run_tests(
         words: master word list for guesses
         solutions: solutions to find
         hard: True for hard mode
+        capture_alphabet: False to leave out the alphabet status of each guess
 
     Returns:
         dict of test outcomes
     """
+    # pylint: disable=too-many-locals
 
     # Set up outcomes dict and tally counter
     outcomes = {}
     count = 0
 
+    # The running total is updated at most 200 times, and for the last test
+    total = len(solutions)
+    step = max(1, total // 200)
+
+    # Build per-word data before the worker processes are started
+    # so that forked workers don't each have to build it again
+    index_words(words)
+
     # Get word scores for the first guess (this will be the same for every test)
+    # Only the top five are needed
     rule_set = RuleSet()
-    init_scores = rule_set.score_words(words, words)
+    init_scores = rule_set.score_words(words, words, top_k=5)
 
-    # Set up function for Executor.map()
-    testfunc = partial(_test_one, words, init_scores, hard=hard)
+    # Set up test function - this is handed to each worker once when it starts
+    # so the word list isn't pickled and sent again with every test
+    testfunc = partial(
+        _test_one, words, init_scores, hard=hard, capture_alphabet=capture_alphabet
+    )
 
     # Hide cursor for running total
     print("\033[?25l", end="")
 
     # Tests are processor-intensive
     # So multi-processing is used to speed things up
-    with ProcessPoolExecutor() as executor:
+    max_workers = _max_workers(len(solutions))
+
+    # Solutions are sent to the workers in chunks to cut down on round trips
+    # Several chunks per worker keep the workers evenly loaded
+    chunksize = max(1, len(solutions) // (max_workers * 8))
+
+    # Forked workers start with the word data built above already in place
+    # whereas forkserver / spawn workers have to import and build it again
+    # Fork is only used on Linux: other platforms' defaults avoid it on purpose
+    # (e.g. forking is unsafe with macOS system frameworks)
+    context = mp.get_context("fork") if sys.platform == "linux" else None
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(testfunc,),
+    ) as executor:
 
         for solution, outcome in zip(
             solutions,
-            executor.map(testfunc, solutions),
+            executor.map(_worker_test_one, solutions, chunksize=chunksize),
         ):
             outcomes[solution] = outcome
             count += 1
-            print(
-                f"Test count:   {count}/{len(solutions)} [{int(count*100/len(solutions))}%]",
-                end="\r",
-            )
+            if count % step == 0 or count == total:
+                print(
+                    f"Test count:   {count}/{total} [{count * 100 // total}%]", end="\r"
+                )
 
     # Restore cursor
     print("\033[?25h", end="")
@@ -454,16 +543,39 @@ def _run_tests(
     return outcomes
 
 
+def _max_workers(count: int) -> int:
+    """Returns the number of worker processes to run tests with
+
+    One worker per core, but no more workers than there are tests:
+    each worker has its own start-up cost and its own cache to build up
+
+    Args:
+        count: number of tests to run
+    """
+    cpus = os.cpu_count() or 1
+
+    # ProcessPoolExecutor allows no more than 61 workers on Windows
+    if sys.platform == "win32":
+        cpus = min(cpus, 61)
+
+    return max(1, min(cpus, count))
+
+
 def _test_one(
-    words: list[str], init_scores: list[WordScore], solution: str, hard: bool = False
+    words: list[str],
+    init_scores: list[WordScore],
+    solution: str,
+    hard: bool = False,
+    capture_alphabet: bool = True,
 ) -> TestOutcome:
     """Runs a test solve for a single solution
 
     Args:
         words: word list to take guesses from
-        init_scores: set of word scores for the first guess
+        init_scores: highest word scores for the first guess (at least the top 5)
         solution: word to find
         hard: True for hard mode, False otherwise (the default)
+        capture_alphabet: False to leave out the alphabet status (default True)
 
     Returns a list of dicts with information about each guess:
         "scores": the top 5 scored words as WordScore objects
@@ -472,6 +584,7 @@ def _test_one(
         "outcome": the outcome when matched against the solution
         "matches": the first 5 remaining matches (in alphabetical order)
         "match_count": the total number of remaining matches
+        "alphabet": the alphabet status (None if capture_alphabet is False)
 
     """
 
@@ -481,12 +594,16 @@ def _test_one(
     rule_set = RuleSet()
     guesses = []
 
+    # Outcomes so far - these determine every guess and match list
+    history: tuple[str, ...] = ()
+
     # Cycle through guesses (max 6)
     for guess_number in range(1, 7):
 
         # For the first guess the word scores are always the same
+        # and every word has been scored
         if guess_number == 1:
-            word_scores = init_scores
+            scores, score_count = init_scores[:5], len(words)
 
         # For other guesses the scored word list needs to be built
         else:
@@ -495,28 +612,33 @@ def _test_one(
             # the Solver has failed and will just guess the match
             # with the highest word frequemcy.
             # Otherwise score all words
-            word_scores = rule_set.score_words(
-                matches if (hard or guess_number == 6) else words, matches
+            scores, score_count = _cached(
+                ("scores", history),
+                _top_scores,
+                rule_set,
+                matches if (hard or guess_number == 6) else words,
+                matches,
             )
 
         # Guess the highest scoring word
-        guess = word_scores[0][0]
+        guess = scores[0][0]
 
         # Get outcome, add to ruleset and filter matches
         outcome = _get_outcome(guess, solution)
         rule_set.add_outcome(guess, outcome)
-        matches = rule_set.filter_matches(matches)
+        history += (outcome,)
+        matches = _cached(("matches", history), rule_set.filter_matches, matches)
 
         # Guess info
         guesses.append(
             GuessOutcome(
-                scores=word_scores[:5],
-                score_count=len(word_scores),
+                scores=scores,
+                score_count=score_count,
                 guess=guess,
                 outcome=outcome,
                 matches=matches[:5],
                 match_count=len(matches),
-                alphabet=rule_set.get_alphabet_status(),
+                alphabet=rule_set.get_alphabet_status() if capture_alphabet else None,
             )
         )
 
@@ -524,3 +646,66 @@ def _test_one(
             break
 
     return guesses
+
+
+def _top_scores(
+    rule_set: RuleSet, words: list[str], matches: list[str]
+) -> tuple[list[WordScore], int]:
+    """Scores words and returns only what a test solve needs
+
+    Args:
+        rule_set: RuleSet to score with
+        words: words to score
+        matches: matches to rule_set
+
+    Returns:
+        (top 5 WordScores, total number of words scored)
+    """
+    # score_words() only scores the matches once there are fewer than three
+    score_count = len(matches) if len(matches) < 3 else len(words)
+    return rule_set.score_words(words, matches, top_k=5), score_count
+
+
+def _init_worker(testfunc: Callable[[str], TestOutcome]):
+    """Initializer for test mode worker processes
+
+    Every test solve in a worker uses the same word list,
+    and solves make the same guesses until their outcomes differ.
+    So each worker starts an empty cache of results
+    keyed by the outcomes seen so far (see _cached()).
+
+    Args:
+        testfunc: function to run a test solve for a given solution
+    """
+    global _worker_cache, _worker_test  # pylint: disable=global-statement,invalid-name
+    _worker_cache = {}
+    _worker_test = testfunc
+
+
+def _worker_test_one(solution: str) -> TestOutcome:
+    """Runs a test solve in a worker process - see _init_worker()
+
+    Args:
+        solution: word to find
+    """
+    assert _worker_test is not None
+    return _worker_test(solution)
+
+
+def _cached(key: tuple, func: Callable, *args: Any) -> Any:
+    """Returns func(*args), cached by key in test mode worker processes
+
+    Outside worker processes there is no cache and func(*args) is always called.
+
+    Args:
+        key: cache key - must identify the result for this worker's word list
+        func: function to call on a cache miss
+        args: arguments for func
+    """
+    if _worker_cache is None:
+        return func(*args)
+
+    if key not in _worker_cache:
+        _worker_cache[key] = func(*args)
+
+    return _worker_cache[key]